@@ -7,39 +7,207 @@ A GTK4/libadwaita application for controlling fans on Bosgame M5 / Sixunited AXB
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, GLib, Gio
+from gi.repository import Gtk, Gdk, Adw, GLib, Gio
 import os
+import re
 import subprocess
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 SYSFS_BASE = "/sys/class/ec_su_axb35"
 
-# All temperature sensors to monitor
+# EC fan directories and their card titles, in display order
+FANS = (("fan1", "CPU Fan 1"), ("fan2", "CPU Fan 2"), ("fan3", "System Fan"))
+
+# Optional aggregate EC attribute holding every field below in one line:
+# "rpm1 rpm2 rpm3 mode1 mode2 mode3 level1 level2 level3 power_mode".
+# Current ec_su_axb35 releases don't provide it, then per-file reads are used.
+STATUS_ATTR = "status"
+STATUS_FIELDS = tuple(f"{fan_id}/{attr}" for attr in ("rpm", "mode", "level") for fan_id, name in FANS) + ("apu/power_mode",)
+
+# Trailing bytes stripped from raw attribute reads
+SYSFS_WHITESPACE = b" \n\t\x00"
+
+CONFIG_PATH = "/etc/bosgame-fan-control.conf"
+# Quoted value of a KEY="value" line, optionally followed by a comment
+CONF_VALUE_RE = re.compile(rb'"([^"]*)"[ \t]*(?:#.*)?')
+
+# Where ryzenadj usually lives, and where one found elsewhere is remembered
+RYZENADJ_PATHS = ("/usr/bin/ryzenadj", "/usr/local/bin/ryzenadj")
+RYZENADJ_CACHE = os.path.join(GLib.get_user_cache_dir(), "bosgame-fan-control", "ryzenadj_path")
+
+GPU_LEVEL_PATH = "/sys/class/drm/card1/device/power_dpm_force_performance_level"
+
+# All temperature sensors to monitor. "slow" sensors change gradually and
+# are only polled every SLOW_SENSOR_TICKS ticks.
 TEMP_SENSORS = [
-    {"path": "/sys/class/hwmon/hwmon4/temp1_input", "name": "CPU (Tctl)", "divisor": 1000},
-    {"path": "/sys/class/ec_su_axb35/temp1/temp", "name": "EC Sensor", "divisor": 1},
-    {"path": "/sys/class/hwmon/hwmon1/temp1_input", "name": "GPU (Edge)", "divisor": 1000},
-    {"path": "/sys/class/hwmon/hwmon2/temp1_input", "name": "NVMe 1", "divisor": 1000},
-    {"path": "/sys/class/hwmon/hwmon3/temp1_input", "name": "NVMe 2", "divisor": 1000},
-    {"path": "/sys/class/hwmon/hwmon7/temp1_input", "name": "WiFi", "divisor": 1000},
-    {"path": "/sys/class/hwmon/hwmon5/temp1_input", "name": "Ethernet", "divisor": 1000},
+    {"path": "/sys/class/hwmon/hwmon4/temp1_input", "name": "CPU (Tctl)", "divisor": 1000, "priority": "fast"},
+    {"path": "/sys/class/ec_su_axb35/temp1/temp", "name": "EC Sensor", "divisor": 1, "priority": "fast"},
+    {"path": "/sys/class/hwmon/hwmon1/temp1_input", "name": "GPU (Edge)", "divisor": 1000, "priority": "slow"},
+    {"path": "/sys/class/hwmon/hwmon2/temp1_input", "name": "NVMe 1", "divisor": 1000, "priority": "slow"},
+    {"path": "/sys/class/hwmon/hwmon3/temp1_input", "name": "NVMe 2", "divisor": 1000, "priority": "slow"},
+    {"path": "/sys/class/hwmon/hwmon7/temp1_input", "name": "WiFi", "divisor": 1000, "priority": "slow"},
+    {"path": "/sys/class/hwmon/hwmon5/temp1_input", "name": "Ethernet", "divisor": 1000, "priority": "slow"},
 ]
 
-# Power sensors (in microwatts)
+# Power sensors (in microwatts), power1_average is already a rolling average
 POWER_SENSORS = [
-    {"path": "/sys/devices/pci0000:00/0000:00:08.1/0000:c6:00.0/hwmon/hwmon3/power1_average", "name": "APU Power", "divisor": 1000000},
+    {"path": "/sys/devices/pci0000:00/0000:00:08.1/0000:c6:00.0/hwmon/hwmon3/power1_average", "name": "APU Power", "divisor": 1000000, "priority": "slow"},
 ]
 
+def can_open(path):
+    """Whether path opens for reading, one open(2) instead of stat(2) plus a later open"""
+    try:
+        os.close(os.open(path, os.O_RDONLY | os.O_CLOEXEC))
+    except OSError:
+        return False
+    return True
+
+def discover_sensors(sensors):
+    """Return the sensors present on this machine as (name, path, divisor, priority) tuples"""
+    return tuple((s["name"], s["path"], s["divisor"], s["priority"])
+                 for s in sensors if can_open(s["path"]))
+
+# Sensor presence doesn't change while we run, probe once at import
+AVAILABLE_TEMP_SENSORS = discover_sensors(TEMP_SENSORS)
+AVAILABLE_POWER_SENSORS = discover_sensors(POWER_SENSORS)
+
+# Poll interval in seconds while temperatures move, and once they settled
+TICK_ACTIVE = 2
+TICK_IDLE = 10
+# Ticks without a 1°C change before dropping to TICK_IDLE
+STABLE_TICKS = 3
+# Slow sensors are read on every Nth tick only
+SLOW_SENSOR_TICKS = 4
+# Failed opens (missing or forbidden) before a path is no longer retried
+DEAD_PATH_STRIKES = 3
+# Fan levels 0-5 as written to sysfs
+LEVEL_BYTES = tuple(str(level).encode() for level in range(6))
+# Level writes while a scale is dragged are coalesced over this many ms
+LEVEL_WRITE_DELAY = 150
+# Visible fan cards are re-checked this many ms after scrolling stops
+SCROLL_SETTLE_DELAY = 200
+
+# Combo row entries, in row order
+FAN_MODES = ("auto", "fixed", "curve")
+POWER_MODES = ("quiet", "balanced", "performance")
+GPU_LEVELS = ("auto", "low", "high")
+
+# Raw sysfs values -> combo row index, matched on bytes without decoding
+FAN_MODE_INDEX = {mode.encode(): i for i, mode in enumerate(FAN_MODES)}
+POWER_MODE_INDEX = {mode.encode(): i for i, mode in enumerate(POWER_MODES)}
+GPU_LEVEL_INDEX = {level.encode(): i for i, level in enumerate(GPU_LEVELS)}
+
+# Preformatted temperature labels, indexed by whole degrees
+CELSIUS_LABELS = tuple(f"{i}°C" for i in range(151))
+# Same labels keyed by the raw reading of a sensor that reports whole degrees
+CELSIUS_BY_RAW = {str(i).encode(): label for i, label in enumerate(CELSIUS_LABELS)}
+
+def find_ryzenadj():
+    """Return whether ryzenadj is installed, remembering where it was found
+
+    The usual install locations are checked first. Otherwise a cached path
+    that is still executable saves the PATH walk of shutil.which(). A
+    missing binary is not cached, so installing ryzenadj later is noticed
+    on the next launch.
+    """
+    if any(os.access(path, os.X_OK) for path in RYZENADJ_PATHS):
+        return True
+    try:
+        with open(RYZENADJ_CACHE) as f:
+            cached = f.read().strip()
+        if cached and os.access(cached, os.X_OK):
+            return True
+    except OSError:
+        pass
+
+    path = shutil.which("ryzenadj")
+    if path is None:
+        return False
+    try:
+        os.makedirs(os.path.dirname(RYZENADJ_CACHE), exist_ok=True)
+        with open(RYZENADJ_CACHE, "w") as f:
+            f.write(path)
+    except OSError:
+        pass
+    return True
+
+# A plain integer reading: at most one minus sign, then ASCII digits
+INT_RE = re.compile(rb"-?[0-9]+")
+
+def is_int(raw):
+    """Whether a raw reading holds a plain integer, checked without raising"""
+    return bool(raw) and INT_RE.fullmatch(raw) is not None
+
+def celsius_formatter(divisor):
+    """Build a raw reading -> label text function for one temperature sensor"""
+    if divisor == 1:
+        def fmt(raw):
+            return CELSIUS_BY_RAW.get(raw) or f"{int(raw)}°C"
+        return fmt
+    half = divisor // 2
+    def fmt(raw):
+        temp = (int(raw) + half) // divisor
+        if 0 <= temp < len(CELSIUS_LABELS):
+            return CELSIUS_LABELS[temp]
+        return f"{temp}°C"
+    return fmt
+
+def watt_formatter(divisor):
+    """Build a raw reading -> label text function for one power sensor"""
+    if divisor % 10:
+        def fmt(raw):
+            return f"{int(raw) / divisor:.1f}W"
+        return fmt
+    # Round to tenths in integer math and split off the decimal digit. Work
+    # on the magnitude, floor division would round negatives the wrong way.
+    tenth = divisor // 10
+    half = tenth // 2
+    def fmt(raw):
+        value = int(raw)
+        watts, frac = divmod((abs(value) + half) // tenth, 10)
+        return f"{'-' if value < 0 else ''}{watts}.{frac}W"
+    return fmt
+
+def label_updater(label, fmt, fallback):
+    """Build an update function for one label, specialized at card creation
+
+    The returned function takes a raw reading and skips readings that are
+    empty or identical to the previous one. The label is only touched when
+    its text actually changes, so GTK doesn't re-measure the row.
+    """
+    set_label = label.set_label
+    last_raw = None
+    last_text = None
+    def update(raw):
+        nonlocal last_raw, last_text
+        if not raw or raw == last_raw:
+            return
+        last_raw = raw
+        # Garbage reads happen while the EC resets, check instead of catching
+        text = fmt(raw) if is_int(raw) else fallback
+        if text != last_text:
+            last_text = text
+            set_label(text)
+    return update
+
 class FanControlApp(Adw.Application):
     def __init__(self):
         super().__init__(application_id="org.bosgame.fancontrol",
                          flags=Gio.ApplicationFlags.FLAGS_NONE)
         self.connect('activate', self.on_activate)
+        self.connect('shutdown', self.on_shutdown)
 
     def on_activate(self, app):
         self.win = FanControlWindow(application=app)
         self.win.present()
 
+    def on_shutdown(self, app):
+        # Also covers quitting without a close-request, e.g. app.quit()
+        if hasattr(self, 'win'):
+            self.win.release_resources()
+
 class FanControlWindow(Adw.ApplicationWindow):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -47,7 +215,39 @@ class FanControlWindow(Adw.ApplicationWindow):
         self.set_default_size(550, 1100)
 
         # Check if ryzenadj is available
-        self.has_ryzenadj = shutil.which("ryzenadj") is not None
+        self.has_ryzenadj = find_ryzenadj()
+
+        # Parsed config file, see load_tuning_config()
+        self._config_cache = None
+
+        # Sysfs attributes are opened once and re-read with pread, the
+        # writable ones get a second descriptor for pwrite
+        self._fds = {}
+        self._write_fds = {}
+        # Reads land in a per-thread scratch buffer, unchanged values reuse
+        # the previous bytes object instead of allocating a new one
+        self._scratch = threading.local()
+        # Persistent I/O threads, hwmon reads of one batch run in parallel.
+        # Only single reads and writes go there. Jobs that wait on them run
+        # one at a time on _job_pool, so they can never take up every
+        # _io_pool thread and starve their own reads.
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="sysfs")
+        self._job_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sysfs-job")
+        self._last_raw = {}
+        # Paths that keep failing to open are not retried, see add_strike()
+        self._strikes = {}
+        self._dead_paths = set()
+        # read_many() batches split into EC and other paths
+        self._batch_split = {}
+        self._last_values = None
+        # At most one read batch in flight, a refresh asked for meanwhile
+        # runs once it is done, see end_batch()
+        self._refresh_inflight = False
+        self._refresh_queued = False
+        self._watched_queued = False
+        self._level_pending = {}
+        self._level_timer = 0
+        self.connect("close-request", self.on_close_request)
 
         # Main box
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -62,11 +262,18 @@ class FanControlWindow(Adw.ApplicationWindow):
         refresh_btn.connect("clicked", self.refresh_all)
         header.pack_end(refresh_btn)
 
+        # Shown while the EC driver is unloaded
+        self.driver_banner = Adw.Banner(title="EC-Treiber nicht geladen: sudo modprobe ec_su_axb35")
+        self.driver_banner.set_button_label("Schließen")
+        self.driver_banner.connect("button-clicked", lambda banner: banner.set_revealed(False))
+        main_box.append(self.driver_banner)
+
         # Scrolled window
         scroll = Gtk.ScrolledWindow()
         scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scroll.set_vexpand(True)
         main_box.append(scroll)
+        self._scroll = scroll
 
         # Content box
         content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
@@ -86,7 +293,7 @@ class FanControlWindow(Adw.ApplicationWindow):
 
         # Fan cards in a more compact layout
         self.fan_cards = {}
-        for fan_id, fan_name in [("fan1", "CPU Fan 1"), ("fan2", "CPU Fan 2"), ("fan3", "System Fan")]:
+        for fan_id, fan_name in FANS:
             card = self.create_fan_card(fan_id, fan_name)
             self.fan_cards[fan_id] = card
             content.append(card["widget"])
@@ -108,69 +315,241 @@ class FanControlWindow(Adw.ApplicationWindow):
             self.tuning_card = self.create_tuning_card()
             content.append(self.tuning_card)
 
-        # Flag for loading saved settings on first refresh
-        self._first_load = True
+        # Absolute paths of the attributes that are watched instead of read
+        self._power_mode_path = f"{SYSFS_BASE}/apu/power_mode"
+        self._rampup_path = self.fan_cards["fan1"]["rampup_path"]
+        self._rampdown_path = self.fan_cards["fan1"]["rampdown_path"]
+
+        self._monitors = []
+        self.watch_ec_files()
+
+        # Everything polled by auto_refresh, read as one batch per tick
+        self._sensor_updaters = tuple(
+            [(path, info["update"]) for path, info in self.temp_labels.items()] +
+            [(path, info["update"]) for path, info in self.power_labels.items()] +
+            [(card["rpm_path"], card["update_rpm"]) for card in self.fan_cards.values()])
+        self._all_poll_paths = tuple(path for path, update in self._sensor_updaters)
+        self._rpm_paths = tuple(card["rpm_path"] for card in self.fan_cards.values())
+        self._temp_divisors = tuple((path, info["divisor"]) for path, info in self.temp_labels.items())
+
+        # One read of the aggregate status attribute replaces the EC reads
+        # Probing with read_raw leaves the descriptor cached for the first tick
+        self._status_path = f"{SYSFS_BASE}/{STATUS_ATTR}"
+        if self.read_raw(self._status_path) is None:
+            self._status_path = None
+        self._status_keys = tuple(f"{SYSFS_BASE}/{field}" for field in STATUS_FIELDS)
+        self._status_cache = (None, None)
+
+        # Slow sensors are left out of the ticks in between
+        self._slow_paths = frozenset(path for labels in (self.temp_labels, self.power_labels)
+                                     for path, info in labels.items() if info["priority"] == "slow")
+        self._tick_count = 0
+
+        # RPM of fan cards scrolled out of view isn't read, see update_visible_cards()
+        self._hidden_paths = frozenset()
+        self._scroll_settle_id = 0
+        self.build_poll_paths()
+        vadjustment = scroll.get_vadjustment()
+        vadjustment.connect("value-changed", self.on_scrolled)
+        vadjustment.connect("changed", self.on_scrolled)
+
+        # All periodic work hangs off one timer so wakeups stay grouped
+        self._tick_jobs = [self.auto_refresh]
+        self._tick_interval = TICK_ACTIVE
+        self._tick_id = GLib.timeout_add_seconds(self._tick_interval, self._tick)
+
+        # Poll slower while temperatures are steady, see poll_fast()
+        self._stable_ticks = 0
+        self._last_temps = {}
+
+        # Slow existence check that replaces the timer while the driver is gone
+        self._driver_check_id = 0
 
         # Initial load
-        self.refresh_all(None)
-
-        # Auto-refresh every 2 seconds
-        GLib.timeout_add_seconds(2, self.auto_refresh)
-
-    def read_file(self, path):
-        """Read any file"""
+        self.refresh_all(None, watched=True)
+
+        # Ticks are skipped while hidden, catch up when the window comes back
+        self._missed_tick = False
+        self.connect("notify::is-active", self.on_active_changed)
+        # An unmapped window doesn't need a timer at all
+        self.connect("unmap", self.on_unmap)
+        self.connect("map", self.on_map)
+
+    def read_raw(self, path):
+        """Read a sysfs attribute as bytes through a cached file descriptor"""
+        fd = self._fds.get(path)
+        if fd is None and path in self._dead_paths:
+            return None
+        view = self.scratch_view()
         try:
-            with open(path, "r") as f:
-                return f.read().strip()
-        except:
+            if fd is None:
+                try:
+                    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+                except (FileNotFoundError, PermissionError):
+                    self.add_strike(path)
+                    raise
+                # Reads also run on the worker thread, keep whichever fd won
+                cached = self._fds.setdefault(path, fd)
+                if cached != fd:
+                    os.close(fd)
+                    fd = cached
+            n = os.preadv(fd, [view], 0)
+        except OSError:
+            # Drop the stale descriptor (e.g. driver reloaded) so the next read
+            # reopens. The write fd may be in use on the main loop, leave it alone.
+            if fd is not None and self._fds.get(path) == fd:
+                self.drop_fd(self._fds, path)
             return None
 
-    def read_sysfs(self, path):
-        """Read a sysfs file from EC driver"""
-        return self.read_file(f"{SYSFS_BASE}/{path}")
+        last = self._last_raw.get(path)
+        if last is not None and view[:n] == last[0]:
+            return last[1]
+        raw = view[:n].tobytes()
+        data = raw.rstrip(SYSFS_WHITESPACE)
+        self._last_raw[path] = (raw, data)
+        return data
+
+    def add_strike(self, path):
+        """Count a failed open, give up on the path after DEAD_PATH_STRIKES"""
+        strikes = self._strikes.get(path, 0) + 1
+        self._strikes[path] = strikes
+        if strikes >= DEAD_PATH_STRIKES:
+            self._dead_paths.add(path)
+
+    def revive_paths(self):
+        """Retry every path given up on by add_strike()"""
+        self._strikes.clear()
+        self._dead_paths.clear()
+
+    def scratch_view(self):
+        """64 byte read buffer owned by the calling thread"""
+        view = getattr(self._scratch, "view", None)
+        if view is None:
+            view = self._scratch.view = memoryview(bytearray(64))
+        return view
+
+    def close_fd(self, path):
+        """Close and forget the cached file descriptors of path"""
+        for fds in (self._fds, self._write_fds):
+            self.drop_fd(fds, path)
+
+    def drop_fd(self, fds, path):
+        """Close and forget the descriptor of path cached in fds"""
+        fd = fds.pop(path, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
 
-    def write_sysfs(self, path, value):
-        """Write to a sysfs file directly"""
+    def on_close_request(self, window):
+        """Release resources when the window is closed"""
+        self.release_resources()
+        return False
+
+    def release_resources(self):
+        """Stop the timers and I/O threads and close cached file descriptors"""
+        if self._tick_id:
+            GLib.source_remove(self._tick_id)
+            self._tick_id = 0
+        if self._driver_check_id:
+            GLib.source_remove(self._driver_check_id)
+            self._driver_check_id = 0
+        if self._scroll_settle_id:
+            GLib.source_remove(self._scroll_settle_id)
+            self._scroll_settle_id = 0
+        # Don't drop the last level the user picked
+        if self._level_timer:
+            GLib.source_remove(self._level_timer)
+            self.flush_levels()
+        self._job_pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        for path in {*self._fds, *self._write_fds}:
+            self.close_fd(path)
+
+    def write_raw(self, path, value):
+        """Write a str or bytes value to a sysfs attribute with one pwrite(2)"""
+        fd = self._write_fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
+            # Curve writes run on pool threads, keep whichever fd won
+            cached = self._write_fds.setdefault(path, fd)
+            if cached != fd:
+                os.close(fd)
+                fd = cached
+        if isinstance(value, str):
+            value = value.encode()
         try:
-            full_path = f"{SYSFS_BASE}/{path}"
-            with open(full_path, "w") as f:
-                f.write(value)
-            return True
-        except PermissionError:
-            self.show_error("Keine Berechtigung",
-                "Führe aus:\nsudo /usr/local/bin/fan-control.sh start")
-            return False
+            os.pwrite(fd, value, 0)
+        except OSError:
+            # The descriptor may be stale (driver reloaded), reopen on the next write
+            if self._write_fds.get(path) == fd:
+                self.drop_fd(self._write_fds, path)
+            raise
+
+    def try_write(self, pair):
+        """Write one (path, value) pair, returns the exception instead of raising it"""
+        try:
+            self.write_raw(*pair)
         except Exception as e:
-            self.show_error("Fehler", str(e))
-            return False
+            return e
+        return None
 
-    def run_ryzenadj(self, *args):
-        """Run ryzenadj with sudo (no password via sudoers)"""
+    def write_sysfs(self, path, value):
+        """Write to a sysfs file (absolute path) directly"""
+        return self.write_many([(path, value)])
+
+    def write_many(self, pairs):
+        """Write several sysfs files (absolute paths), reporting all failures in one dialog"""
+        return self.report_writes(pairs, [self.try_write(pair) for pair in pairs])
+
+    def report_writes(self, pairs, results):
+        """Show one dialog for the failed writes of a batch, returns whether all succeeded"""
+        denied = False
+        errors = []
+        for (path, value), e in zip(pairs, results):
+            if isinstance(e, PermissionError):
+                denied = True
+            elif e is not None:
+                errors.append(f"{path.removeprefix(SYSFS_BASE + '/')}: {e}")
+
+        if denied:
+            self.show_error("Keine Berechtigung",
+                "Führe aus:\nsudo /usr/local/bin/fan-control.sh start")
+        elif errors:
+            self.show_error("Fehler", "\n".join(errors))
+        return not denied and not errors
+
+    def run_ryzenadj(self, *args, on_success=None):
+        """Run ryzenadj with sudo (no password via sudoers) without blocking the UI"""
+        cmd = ["sudo", "-n", "ryzenadj"] + list(args)
+        flags = Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE
         try:
-            cmd = ["sudo", "ryzenadj"] + list(args)
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if "Sucessfully" in result.stdout or "Successfully" in result.stdout:
-                return True
-            if result.returncode != 0:
-                self.show_error("ryzenadj Fehler", result.stderr or "Unbekannter Fehler")
-                return False
-            return True
-        except Exception as e:
-            self.show_error("Fehler", str(e))
-            return False
+            proc = Gio.Subprocess.new(cmd, flags)
+        except GLib.Error as e:
+            self.show_error("Fehler", e.message)
+            return
+        proc.communicate_utf8_async(None, None, self.on_ryzenadj_done, on_success)
+
+    def on_ryzenadj_done(self, proc, result, on_success):
+        """Check the finished ryzenadj run, call on_success() if it worked"""
+        try:
+            ok, stdout, stderr = proc.communicate_utf8_finish(result)
+        except GLib.Error as e:
+            self.show_error("Fehler", e.message)
+            return
+        stdout = stdout or ""
+        if "Sucessfully" not in stdout and "Successfully" not in stdout and proc.get_exit_status() != 0:
+            self.show_error("ryzenadj Fehler", stderr or "Unbekannter Fehler")
+            return
+        if on_success:
+            on_success()
 
     def save_tuning_config(self, stapm, fast, slow, temp, co, cogfx, gpu_level):
         """Save tuning settings to config file"""
         try:
-            config_path = "/etc/bosgame-fan-control.conf"
-            # Read existing config
-            config = {}
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    for line in f:
-                        if "=" in line and not line.strip().startswith("#"):
-                            key, val = line.strip().split("=", 1)
-                            config[key] = val.strip('"')
+            # Existing config, from the cache unless it was never read
+            config = dict(self.load_tuning_config())
 
             # Update with tuning settings
             config["STAPM_LIMIT"] = str(stapm)
@@ -181,28 +560,58 @@ class FanControlWindow(Adw.ApplicationWindow):
             config["GPU_CO"] = str(cogfx)
             config["GPU_LEVEL"] = gpu_level
 
-            # Write back
-            cmd = ["sudo", "tee", config_path]
+            # Nothing to write if the file already says this
+            if config == self._config_cache:
+                return True
+
+            # Write back, directly if we may replace the file, else through sudo
             content = "\n".join([f'{k}="{v}"' for k, v in config.items()]) + "\n"
-            subprocess.run(cmd, input=content, text=True, capture_output=True)
+            if os.access(os.path.dirname(CONFIG_PATH), os.W_OK):
+                self.replace_file(CONFIG_PATH, content.encode())
+            else:
+                cmd = ["sudo", "-n", "tee", CONFIG_PATH]
+                result = subprocess.run(cmd, input=content, text=True, capture_output=True)
+                if result.returncode != 0:
+                    # The file may or may not have the new content now
+                    self._config_cache = None
+                    self.show_error("Fehler beim Speichern",
+                                    result.stderr.strip() or "Unbekannter Fehler")
+                    return False
+            self._config_cache = config
             return True
         except Exception as e:
+            self._config_cache = None
             self.show_error("Fehler beim Speichern", str(e))
             return False
 
+    def replace_file(self, path, data):
+        """Atomically replace path with data through a temporary file"""
+        tmp = path + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+
     def load_tuning_config(self):
         """Load tuning settings from config file"""
+        if self._config_cache is not None:
+            return self._config_cache
         config = {}
-        config_path = "/etc/bosgame-fan-control.conf"
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, "r") as f:
-                    for line in f:
-                        if "=" in line and not line.strip().startswith("#"):
-                            key, val = line.strip().split("=", 1)
-                            config[key] = val.strip('"')
-            except:
-                pass
+        try:
+            with open(CONFIG_PATH, "rb") as f:
+                data = f.read()
+            for line in data.splitlines():
+                line = line.strip()
+                if b"=" not in line or line.startswith(b"#"):
+                    continue
+                key, val = line.split(b"=", 1)
+                match = CONF_VALUE_RE.fullmatch(val)
+                config[key.decode()] = (match.group(1) if match else val.strip(b'"')).decode()
+        except (OSError, ValueError):
+            pass
+        self._config_cache = config
         return config
 
     def show_error(self, title, message):
@@ -213,70 +622,61 @@ class FanControlWindow(Adw.ApplicationWindow):
 
     def create_temp_card(self):
         """Create temperature display card with all sensors"""
-        card = Adw.PreferencesGroup()
-        card.set_title("Temperaturen")
+        card = Adw.PreferencesGroup(title="Temperaturen")
 
         temp_labels = {}
 
-        for sensor in TEMP_SENSORS:
-            if os.path.exists(sensor["path"]):
-                row = Adw.ActionRow()
-                row.set_title(sensor["name"])
-
-                label = Gtk.Label(label="--°C")
-                label.add_css_class("title-4")
-                row.add_suffix(label)
+        for name, path, divisor, priority in AVAILABLE_TEMP_SENSORS:
+            row = Adw.ActionRow(title=name)
+            label = Gtk.Label(label="--°C", css_classes=["title-4"])
+            row.add_suffix(label)
 
-                card.add(row)
-                temp_labels[sensor["path"]] = {"label": label, "divisor": sensor["divisor"]}
+            card.add(row)
+            temp_labels[path] = {
+                "divisor": divisor,
+                "priority": priority,
+                "update": label_updater(label, celsius_formatter(divisor), "--°C")
+            }
 
         return card, temp_labels
 
     def create_power_display_card(self):
         """Create power display card"""
-        card = Adw.PreferencesGroup()
-        card.set_title("Leistung")
+        card = Adw.PreferencesGroup(title="Leistung")
 
         power_labels = {}
 
-        for sensor in POWER_SENSORS:
-            if os.path.exists(sensor["path"]):
-                row = Adw.ActionRow()
-                row.set_title(sensor["name"])
+        for name, path, divisor, priority in AVAILABLE_POWER_SENSORS:
+            row = Adw.ActionRow(title=name)
+            label = Gtk.Label(label="--W", css_classes=["title-4"])
+            row.add_suffix(label)
 
-                label = Gtk.Label(label="--W")
-                label.add_css_class("title-4")
-                row.add_suffix(label)
-
-                card.add(row)
-                power_labels[sensor["path"]] = {"label": label, "divisor": sensor["divisor"]}
+            card.add(row)
+            power_labels[path] = {
+                "divisor": divisor,
+                "priority": priority,
+                "update": label_updater(label, watt_formatter(divisor), "--W")
+            }
 
         return card, power_labels
 
     def create_fan_card(self, fan_id, fan_name):
         """Create a fan control card"""
-        card = Adw.PreferencesGroup()
-        card.set_title(fan_name)
+        card = Adw.PreferencesGroup(title=fan_name)
 
         # RPM and Mode in one row
-        rpm_row = Adw.ActionRow()
-        rpm_row.set_title("RPM")
-        rpm_label = Gtk.Label(label="--")
-        rpm_label.add_css_class("title-3")
+        rpm_row = Adw.ActionRow(title="RPM")
+        rpm_label = Gtk.Label(label="--", css_classes=["title-3"])
         rpm_row.add_suffix(rpm_label)
         card.add(rpm_row)
 
         # Mode row
-        mode_row = Adw.ComboRow()
-        mode_row.set_title("Modus")
-        modes = Gtk.StringList.new(["auto", "fixed", "curve"])
-        mode_row.set_model(modes)
+        mode_row = Adw.ComboRow(title="Modus", model=Gtk.StringList.new(FAN_MODES))
         mode_row.connect("notify::selected", self.on_mode_changed, fan_id)
         card.add(mode_row)
 
         # Level row with scale
-        level_row = Adw.ActionRow()
-        level_row.set_title("Level")
+        level_row = Adw.ActionRow(title="Level")
 
         level_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0, 5, 1)
         level_scale.set_draw_value(True)
@@ -291,20 +691,23 @@ class FanControlWindow(Adw.ApplicationWindow):
 
         return {
             "widget": card,
-            "rpm_label": rpm_label,
-            "mode_row": mode_row,
-            "level_scale": level_scale
+            "update_rpm": label_updater(rpm_label, bytes.decode, "--"),  # RPM is shown as read
+            "get_mode": mode_row.get_selected,
+            "set_mode": mode_row.set_selected,
+            "get_level": level_scale.get_value,
+            "set_level": level_scale.set_value,
+            "rpm_path": f"{SYSFS_BASE}/{fan_id}/rpm",
+            "mode_path": f"{SYSFS_BASE}/{fan_id}/mode",
+            "level_path": f"{SYSFS_BASE}/{fan_id}/level",
+            "rampup_path": f"{SYSFS_BASE}/{fan_id}/rampup_curve",
+            "rampdown_path": f"{SYSFS_BASE}/{fan_id}/rampdown_curve"
         }
 
     def create_power_card(self):
         """Create power mode card"""
-        card = Adw.PreferencesGroup()
-        card.set_title("APU Power Mode")
+        card = Adw.PreferencesGroup(title="APU Power Mode")
 
-        mode_row = Adw.ComboRow()
-        mode_row.set_title("Modus")
-        modes = Gtk.StringList.new(["quiet", "balanced", "performance"])
-        mode_row.set_model(modes)
+        mode_row = Adw.ComboRow(title="Modus", model=Gtk.StringList.new(POWER_MODES))
         mode_row.connect("notify::selected", self.on_power_mode_changed)
         card.add(mode_row)
 
@@ -313,37 +716,27 @@ class FanControlWindow(Adw.ApplicationWindow):
 
     def create_curve_card(self):
         """Create curve editor card"""
-        card = Adw.PreferencesGroup()
-        card.set_title("Lüfterkurven")
-        card.set_description("Temp-Schwellen für Level 1-5 (kommagetrennt)")
+        card = Adw.PreferencesGroup(title="Lüfterkurven",
+                                    description="Temp-Schwellen für Level 1-5 (kommagetrennt)")
 
         # Ramp up row
-        rampup_row = Adw.ActionRow()
-        rampup_row.set_title("Ramp-Up (°C)")
-
-        self.rampup_entry = Gtk.Entry()
-        self.rampup_entry.set_placeholder_text("50,60,70,80,90")
-        self.rampup_entry.set_valign(Gtk.Align.CENTER)
-        self.rampup_entry.set_width_chars(14)
+        rampup_row = Adw.ActionRow(title="Ramp-Up (°C)")
+        self.rampup_entry = Gtk.Entry(placeholder_text="50,60,70,80,90",
+                                      valign=Gtk.Align.CENTER, width_chars=14)
         rampup_row.add_suffix(self.rampup_entry)
         card.add(rampup_row)
 
         # Ramp down row
-        rampdown_row = Adw.ActionRow()
-        rampdown_row.set_title("Ramp-Down (°C)")
-
-        self.rampdown_entry = Gtk.Entry()
-        self.rampdown_entry.set_placeholder_text("45,55,65,75,85")
-        self.rampdown_entry.set_valign(Gtk.Align.CENTER)
-        self.rampdown_entry.set_width_chars(14)
+        rampdown_row = Adw.ActionRow(title="Ramp-Down (°C)")
+        self.rampdown_entry = Gtk.Entry(placeholder_text="45,55,65,75,85",
+                                        valign=Gtk.Align.CENTER, width_chars=14)
         rampdown_row.add_suffix(self.rampdown_entry)
         card.add(rampdown_row)
 
         # Apply button
         apply_row = Adw.ActionRow()
-        apply_btn = Gtk.Button(label="Anwenden")
-        apply_btn.add_css_class("suggested-action")
-        apply_btn.set_valign(Gtk.Align.CENTER)
+        apply_btn = Gtk.Button(label="Anwenden", css_classes=["suggested-action"],
+                               valign=Gtk.Align.CENTER)
         apply_btn.connect("clicked", self.apply_curves)
         apply_row.add_suffix(apply_btn)
         card.add(apply_row)
@@ -352,15 +745,11 @@ class FanControlWindow(Adw.ApplicationWindow):
 
     def create_gpu_card(self):
         """Create GPU performance card"""
-        card = Adw.PreferencesGroup()
-        card.set_title("GPU Performance")
+        card = Adw.PreferencesGroup(title="GPU Performance")
 
         # GPU Performance Level
-        gpu_row = Adw.ComboRow()
-        gpu_row.set_title("Performance Level")
-        gpu_row.set_subtitle("auto=dynamisch, high=max Takt")
-        levels = Gtk.StringList.new(["auto", "low", "high"])
-        gpu_row.set_model(levels)
+        gpu_row = Adw.ComboRow(title="Performance Level", subtitle="auto=dynamisch, high=max Takt",
+                               model=Gtk.StringList.new(GPU_LEVELS))
         gpu_row.connect("notify::selected", self.on_gpu_level_changed)
         card.add(gpu_row)
         self.gpu_level_row = gpu_row
@@ -369,135 +758,86 @@ class FanControlWindow(Adw.ApplicationWindow):
 
     def on_gpu_level_changed(self, combo, pspec):
         """Handle GPU performance level change"""
-        levels = ["auto", "low", "high"]
         selected = combo.get_selected()
-        if selected < len(levels):
+        if selected < len(GPU_LEVELS):
             try:
-                with open("/sys/class/drm/card1/device/power_dpm_force_performance_level", "w") as f:
-                    f.write(levels[selected])
+                self.write_raw(GPU_LEVEL_PATH, GPU_LEVELS[selected])
             except PermissionError:
                 self.show_error("Keine Berechtigung",
-                    "GPU-Einstellung erfordert root.\nFühre aus: sudo chmod 666 /sys/class/drm/card1/device/power_dpm_force_performance_level")
+                    f"GPU-Einstellung erfordert root.\nFühre aus: sudo chmod 666 {GPU_LEVEL_PATH}")
             except Exception as e:
                 self.show_error("Fehler", str(e))
 
     def create_tuning_card(self):
-        """Create CPU/GPU tuning card with ryzenadj"""
-        card = Adw.PreferencesGroup()
-        card.set_title("Power Tuning (ryzenadj)")
-        card.set_description("Einstellungen werden bei Neustart zurückgesetzt")
-
-        # STAPM (Sustained Power)
-        stapm_row = Adw.ActionRow()
-        stapm_row.set_title("STAPM (Sustained)")
-        stapm_row.set_subtitle("Dauerhafte TDP")
-
-        self.stapm_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 25, 120, 5)
-        self.stapm_scale.set_value(65)
-        self.stapm_scale.set_draw_value(True)
-        self.stapm_scale.set_value_pos(Gtk.PositionType.LEFT)
-        self.stapm_scale.set_size_request(120, -1)
-        self.stapm_scale.set_valign(Gtk.Align.CENTER)
-        self.stapm_scale.set_format_value_func(lambda scale, val: f"{val:.0f}W")
-        stapm_row.add_suffix(self.stapm_scale)
-        card.add(stapm_row)
-
-        # Fast Limit (Burst Power)
-        fast_row = Adw.ActionRow()
-        fast_row.set_title("Fast Limit (Burst)")
-        fast_row.set_subtitle("Kurzzeit-Boost")
-
-        self.fast_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 25, 150, 5)
-        self.fast_scale.set_value(80)
-        self.fast_scale.set_draw_value(True)
-        self.fast_scale.set_value_pos(Gtk.PositionType.LEFT)
-        self.fast_scale.set_size_request(120, -1)
-        self.fast_scale.set_valign(Gtk.Align.CENTER)
-        self.fast_scale.set_format_value_func(lambda scale, val: f"{val:.0f}W")
-        fast_row.add_suffix(self.fast_scale)
-        card.add(fast_row)
-
-        # Slow Limit
-        slow_row = Adw.ActionRow()
-        slow_row.set_title("Slow Limit")
-        slow_row.set_subtitle("Mittelfristige TDP")
-
-        self.slow_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 25, 120, 5)
-        self.slow_scale.set_value(65)
-        self.slow_scale.set_draw_value(True)
-        self.slow_scale.set_value_pos(Gtk.PositionType.LEFT)
-        self.slow_scale.set_size_request(120, -1)
-        self.slow_scale.set_valign(Gtk.Align.CENTER)
-        self.slow_scale.set_format_value_func(lambda scale, val: f"{val:.0f}W")
-        slow_row.add_suffix(self.slow_scale)
-        card.add(slow_row)
-
-        # Temp Limit
-        temp_row = Adw.ActionRow()
-        temp_row.set_title("Temp Limit")
-        temp_row.set_subtitle("Max CPU Temperatur")
-
-        self.temp_limit_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 80, 100, 1)
-        self.temp_limit_scale.set_value(95)
-        self.temp_limit_scale.set_draw_value(True)
-        self.temp_limit_scale.set_value_pos(Gtk.PositionType.LEFT)
-        self.temp_limit_scale.set_size_request(120, -1)
-        self.temp_limit_scale.set_valign(Gtk.Align.CENTER)
-        self.temp_limit_scale.set_format_value_func(lambda scale, val: f"{val:.0f}°C")
-        temp_row.add_suffix(self.temp_limit_scale)
-        card.add(temp_row)
-
-        # Curve Optimizer (Undervolting)
-        co_row = Adw.ActionRow()
-        co_row.set_title("CPU Undervolt (CO)")
-        co_row.set_subtitle("Negativ = weniger Spannung")
-
-        self.co_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, -30, 10, 1)
-        self.co_scale.set_value(0)
-        self.co_scale.set_draw_value(True)
-        self.co_scale.set_value_pos(Gtk.PositionType.LEFT)
-        self.co_scale.set_size_request(120, -1)
-        self.co_scale.set_valign(Gtk.Align.CENTER)
-        self.co_scale.add_mark(0, Gtk.PositionType.BOTTOM, None)
-        co_row.add_suffix(self.co_scale)
-        card.add(co_row)
-
-        # iGPU Curve Optimizer
-        cogfx_row = Adw.ActionRow()
-        cogfx_row.set_title("iGPU Undervolt (CO)")
-        cogfx_row.set_subtitle("Negativ = weniger Spannung")
-
-        self.cogfx_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, -30, 10, 1)
-        self.cogfx_scale.set_value(0)
-        self.cogfx_scale.set_draw_value(True)
-        self.cogfx_scale.set_value_pos(Gtk.PositionType.LEFT)
-        self.cogfx_scale.set_size_request(120, -1)
-        self.cogfx_scale.set_valign(Gtk.Align.CENTER)
-        self.cogfx_scale.add_mark(0, Gtk.PositionType.BOTTOM, None)
-        cogfx_row.add_suffix(self.cogfx_scale)
-        card.add(cogfx_row)
+        """Create CPU/GPU tuning card with ryzenadj, filled on first expand"""
+        card = Adw.PreferencesGroup(title="Power Tuning (ryzenadj)",
+                                    description="Einstellungen werden bei Neustart zurückgesetzt")
+        # Most sessions never touch tuning, don't build its scales up front
+        expander = Adw.ExpanderRow(title="Limits und Undervolting")
+        expander.connect("notify::expanded", self.on_tuning_expanded)
+        card.add(expander)
+        return card
 
-        # Save checkbox
-        save_row = Adw.ActionRow()
-        save_row.set_title("Beim Booten laden")
-        save_row.set_subtitle("Einstellungen speichern und automatisch anwenden")
+    def on_tuning_expanded(self, expander, pspec):
+        """Build the tuning controls the first time the card is expanded"""
+        if not expander.get_expanded():
+            return
+        expander.disconnect_by_func(self.on_tuning_expanded)
+        add = expander.add_row
+
+        self.stapm_scale = self.add_tuning_scale(
+            add, "STAPM (Sustained)", "Dauerhafte TDP", 25, 120, 5, 65, "W")
+        self.fast_scale = self.add_tuning_scale(
+            add, "Fast Limit (Burst)", "Kurzzeit-Boost", 25, 150, 5, 80, "W")
+        self.slow_scale = self.add_tuning_scale(
+            add, "Slow Limit", "Mittelfristige TDP", 25, 120, 5, 65, "W")
+        self.temp_limit_scale = self.add_tuning_scale(
+            add, "Temp Limit", "Max CPU Temperatur", 80, 100, 1, 95, "°C")
+
+        # Curve Optimizer (Undervolting), marked at 0
+        self.co_scale = self.add_tuning_scale(
+            add, "CPU Undervolt (CO)", "Negativ = weniger Spannung", -30, 10, 1, 0)
+        self.cogfx_scale = self.add_tuning_scale(
+            add, "iGPU Undervolt (CO)", "Negativ = weniger Spannung", -30, 10, 1, 0)
 
-        self.save_tuning_switch = Gtk.Switch()
-        self.save_tuning_switch.set_valign(Gtk.Align.CENTER)
+        # Save checkbox
+        save_row = Adw.ActionRow(title="Beim Booten laden",
+                                 subtitle="Einstellungen speichern und automatisch anwenden")
+        self.save_tuning_switch = Gtk.Switch(valign=Gtk.Align.CENTER)
         save_row.add_suffix(self.save_tuning_switch)
         save_row.set_activatable_widget(self.save_tuning_switch)
-        card.add(save_row)
+        add(save_row)
 
         # Apply button
         apply_row = Adw.ActionRow()
-        apply_btn = Gtk.Button(label="Tuning anwenden")
-        apply_btn.add_css_class("suggested-action")
-        apply_btn.set_valign(Gtk.Align.CENTER)
+        apply_btn = Gtk.Button(label="Tuning anwenden", css_classes=["suggested-action"],
+                               valign=Gtk.Align.CENTER)
         apply_btn.connect("clicked", self.apply_tuning)
         apply_row.add_suffix(apply_btn)
-        card.add(apply_row)
-
-        return card
+        add(apply_row)
+
+        self._load_initial_config()
+
+    def add_tuning_scale(self, add, title, subtitle, lo, hi, step, default, unit=None):
+        """Pass a row with a tuning scale to add() and return the scale
+
+        Scales without a unit get a mark at 0 instead of a formatted value.
+        """
+        row = Adw.ActionRow(title=title, subtitle=subtitle)
+
+        scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, lo, hi, step)
+        scale.set_value(default)
+        scale.set_draw_value(True)
+        scale.set_value_pos(Gtk.PositionType.LEFT)
+        scale.set_size_request(120, -1)
+        scale.set_valign(Gtk.Align.CENTER)
+        if unit is None:
+            scale.add_mark(0, Gtk.PositionType.BOTTOM, None)
+        else:
+            scale.set_format_value_func(lambda scale, val: f"{val:.0f}{unit}")
+        row.add_suffix(scale)
+        add(row)
+        return scale
 
     def apply_tuning(self, button):
         """Apply ryzenadj tuning settings"""
@@ -509,8 +849,7 @@ class FanControlWindow(Adw.ApplicationWindow):
         cogfx = int(self.cogfx_scale.get_value())
 
         # Get GPU level
-        levels = ["auto", "low", "high"]
-        gpu_level = levels[self.gpu_level_row.get_selected()]
+        gpu_level = GPU_LEVELS[self.gpu_level_row.get_selected()]
 
         # Build command
         args = [
@@ -526,171 +865,481 @@ class FanControlWindow(Adw.ApplicationWindow):
         if cogfx != 0:
             args.append(f"--set-cogfx={cogfx}")
 
-        success = self.run_ryzenadj(*args)
-
-        # Save settings if checkbox is checked
-        if success and self.save_tuning_switch.get_active():
-            self.save_tuning_config(
-                int(self.stapm_scale.get_value()),
-                int(self.fast_scale.get_value()),
-                int(self.slow_scale.get_value()),
-                temp, co, cogfx, gpu_level
-            )
-
-    def refresh_all(self, button):
-        """Refresh all values"""
-        # All temperatures
-        for path, info in self.temp_labels.items():
-            val = self.read_file(path)
-            if val:
-                try:
-                    temp = int(val) / info["divisor"]
-                    info["label"].set_label(f"{temp:.0f}°C")
-                except:
-                    info["label"].set_label("--°C")
-
-        # Power
-        for path, info in self.power_labels.items():
-            val = self.read_file(path)
-            if val:
-                try:
-                    power = int(val) / info["divisor"]
-                    info["label"].set_label(f"{power:.1f}W")
-                except:
-                    info["label"].set_label("--W")
-
-        # Fans
-        for fan_id, card in self.fan_cards.items():
-            rpm = self.read_sysfs(f"{fan_id}/rpm")
-            mode = self.read_sysfs(f"{fan_id}/mode")
-            level = self.read_sysfs(f"{fan_id}/level")
-
-            if rpm:
-                card["rpm_label"].set_label(f"{rpm}")
-
-            if mode:
-                modes = ["auto", "fixed", "curve"]
-                if mode in modes:
-                    card["mode_row"].set_selected(modes.index(mode))
-
-            if level:
-                card["level_scale"].set_value(int(level))
-
-        # Power mode
-        power_mode = self.read_sysfs("apu/power_mode")
-        if power_mode:
-            modes = ["quiet", "balanced", "performance"]
-            if power_mode in modes:
-                self.power_mode_row.set_selected(modes.index(power_mode))
-
-        # Curves
-        rampup = self.read_sysfs("fan1/rampup_curve")
-        rampdown = self.read_sysfs("fan1/rampdown_curve")
-        if rampup:
-            self.rampup_entry.set_text(rampup)
-        if rampdown:
-            self.rampdown_entry.set_text(rampdown)
+        # Save settings if checkbox is checked, once ryzenadj succeeded.
+        # Values are taken now, the scales may move while ryzenadj runs.
+        on_success = None
+        if self.save_tuning_switch.get_active():
+            saved = (stapm // 1000, fast // 1000, slow // 1000, temp, co, cogfx, gpu_level)
+            on_success = lambda: self.save_tuning_config(*saved)
+
+        self.run_ryzenadj(*args, on_success=on_success)
+
+    def refresh_all(self, button, watched=False):
+        """Refresh all values, with watched=True also power mode and curves
+
+        Those are normally kept up to date by watch_ec_files(), they are only
+        read on startup and after the driver was reloaded.
+        """
+        # A manual refresh also retries paths that were given up on
+        if button is not None:
+            self.revive_paths()
+        self.poll_fast()
+        if self._refresh_inflight:
+            self._refresh_queued = True
+            self._watched_queued = self._watched_queued or watched
+            return
+        # A stalled driver must not freeze the window, read on a worker
+        self._refresh_inflight = True
+        self._job_pool.submit(self.refresh_worker, watched)
+
+    def refresh_worker(self, watched):
+        """Worker thread: read everything refresh_all shows and pass it to the main loop"""
+        try:
+            values = self.read_sensors()
+            # The status attribute also carries mode, level and power mode,
+            # only read the files it didn't cover
+            def get(path):
+                return values[path] if path in values else self.read_raw(path)
+            modes = {fan_id: get(card["mode_path"]) for fan_id, card in self.fan_cards.items()}
+            levels = {fan_id: get(card["level_path"]) for fan_id, card in self.fan_cards.items()}
+            gpu_level = self.read_raw(GPU_LEVEL_PATH)
+            if watched:
+                watched = (get(self._power_mode_path),
+                           self.read_raw(self._rampup_path),
+                           self.read_raw(self._rampdown_path))
+            GLib.idle_add(self.apply_refresh, values, modes, levels, gpu_level, watched)
+        finally:
+            GLib.idle_add(self.end_batch)
+
+    def end_batch(self):
+        """Main loop: a read batch finished, run a refresh that had to wait for it"""
+        self._refresh_inflight = False
+        if self._refresh_queued:
+            watched = self._watched_queued
+            self._refresh_queued = self._watched_queued = False
+            self.refresh_all(None, watched)
+        return False
+
+    def apply_refresh(self, values, modes, levels, gpu_level, watched):
+        """Main loop: show the values read by refresh_worker"""
+        self.update_sensors(values)
+        # Make the next background read apply its result even if unchanged
+        self._last_values = None
+
+        # Fan mode and level
+        for fan_id in self.fan_cards:
+            self.apply_fan_mode(fan_id, modes[fan_id])
+            self.apply_fan_level(fan_id, levels[fan_id])
 
         # GPU Performance Level
-        gpu_level = self.read_file("/sys/class/drm/card1/device/power_dpm_force_performance_level")
-        if gpu_level:
-            levels = ["auto", "low", "high"]
-            if gpu_level in levels:
-                self.gpu_level_row.set_selected(levels.index(gpu_level))
-
-        # Load saved tuning settings (only on first load)
-        if self.has_ryzenadj and hasattr(self, '_first_load'):
-            config = self.load_tuning_config()
-            if config.get("STAPM_LIMIT"):
-                try:
-                    self.stapm_scale.set_value(int(config["STAPM_LIMIT"]))
-                    self.save_tuning_switch.set_active(True)
-                except: pass
-            if config.get("FAST_LIMIT"):
-                try: self.fast_scale.set_value(int(config["FAST_LIMIT"]))
-                except: pass
-            if config.get("SLOW_LIMIT"):
-                try: self.slow_scale.set_value(int(config["SLOW_LIMIT"]))
-                except: pass
-            if config.get("TEMP_LIMIT"):
-                try: self.temp_limit_scale.set_value(int(config["TEMP_LIMIT"]))
-                except: pass
-            if config.get("CPU_CO"):
-                try: self.co_scale.set_value(int(config["CPU_CO"]))
-                except: pass
-            if config.get("GPU_CO"):
-                try: self.cogfx_scale.set_value(int(config["GPU_CO"]))
-                except: pass
-            del self._first_load
-
-        return True
+        idx = GPU_LEVEL_INDEX.get(gpu_level)
+        if idx is not None and self.gpu_level_row.get_selected() != idx:
+            self.gpu_level_row.set_selected(idx)
+
+        # Power mode and curves, only read when asked for
+        if watched:
+            power_mode, rampup, rampdown = watched
+            self.apply_power_mode(power_mode)
+            self.apply_curve(self.rampup_entry, rampup)
+            self.apply_curve(self.rampdown_entry, rampdown)
+        return False
+
+    def _load_initial_config(self):
+        """Load saved tuning settings into the tuning card, once it is built"""
+        config = self.load_tuning_config()
+        if config.get("STAPM_LIMIT"):
+            try:
+                self.stapm_scale.set_value(int(config["STAPM_LIMIT"]))
+                self.save_tuning_switch.set_active(True)
+            except: pass
+        if config.get("FAST_LIMIT"):
+            try: self.fast_scale.set_value(int(config["FAST_LIMIT"]))
+            except: pass
+        if config.get("SLOW_LIMIT"):
+            try: self.slow_scale.set_value(int(config["SLOW_LIMIT"]))
+            except: pass
+        if config.get("TEMP_LIMIT"):
+            try: self.temp_limit_scale.set_value(int(config["TEMP_LIMIT"]))
+            except: pass
+        if config.get("CPU_CO"):
+            try: self.co_scale.set_value(int(config["CPU_CO"]))
+            except: pass
+        if config.get("GPU_CO"):
+            try: self.cogfx_scale.set_value(int(config["GPU_CO"]))
+            except: pass
 
     def auto_refresh(self):
         """Auto-refresh callback - only temps, power and RPM"""
-        # All temperatures
-        for path, info in self.temp_labels.items():
-            val = self.read_file(path)
-            if val:
-                try:
-                    temp = int(val) / info["divisor"]
-                    info["label"].set_label(f"{temp:.0f}°C")
-                except:
-                    pass
-
-        # Power
-        for path, info in self.power_labels.items():
-            val = self.read_file(path)
-            if val:
-                try:
-                    power = int(val) / info["divisor"]
-                    info["label"].set_label(f"{power:.1f}W")
-                except:
-                    pass
+        # Previous batch still stuck on a slow EC, don't queue another one
+        if self._refresh_inflight:
+            return
+        # Read on a worker thread so a slow EC can't stall the UI
+        self._tick_count += 1
+        include_slow = self._tick_count % SLOW_SENSOR_TICKS == 0
+        self._refresh_inflight = True
+        self._job_pool.submit(self.read_sensors_worker, include_slow)
+
+    def read_sensors_worker(self, include_slow=True):
+        """Worker thread: read sensors and pass changed values to the main loop"""
+        try:
+            self.publish_sensor_values(self.read_sensors(include_slow), include_slow)
+        finally:
+            # Cleared on the main loop, where refresh_all checks it
+            GLib.idle_add(self.end_batch)
+
+    def publish_sensor_values(self, values, include_slow):
+        """Worker thread: hand values to the main loop unless nothing changed"""
+        # Slow sensors skipped this tick keep their previous reading
+        if not include_slow and self._last_values:
+            values = {**self._last_values, **values}
+        # Nothing changed since the last tick, no need to wake the main loop
+        if values == self._last_values:
+            return
+        self._last_values = values
+        GLib.idle_add(self.apply_sensor_values, values)
+
+    def apply_sensor_values(self, values):
+        """Main loop: apply values read by the worker thread"""
+        self.update_sensors(values)
+        if self.temps_moved(values):
+            self.poll_fast()
+        # A failing RPM read usually means the driver was unloaded
+        rpms = [values[path] for path in self._rpm_paths if path in values]
+        if not any(rpms) and not os.path.isdir(SYSFS_BASE):
+            self.on_driver_lost()
+        return False
+
+    def on_driver_lost(self):
+        """Stop polling and wait for the EC driver to come back"""
+        if self._tick_id:
+            GLib.source_remove(self._tick_id)
+            self._tick_id = 0
+        self.driver_banner.set_revealed(True)
+        if not self._driver_check_id:
+            self._driver_check_id = GLib.timeout_add_seconds(TICK_IDLE, self.check_driver)
+
+    def check_driver(self):
+        """Timer callback while the driver is gone"""
+        if not os.path.isdir(SYSFS_BASE):
+            return True
+        self._driver_check_id = 0
+        self.on_driver_back()
+        return False
+
+    def on_driver_back(self):
+        """Reconnect to a reloaded EC driver and resume polling"""
+        # Cached descriptors and file watches still point at the removed attributes
+        for path in {*self._fds, *self._write_fds}:
+            self.close_fd(path)
+        self._last_raw.clear()
+        self.revive_paths()
+        self.watch_ec_files()
+        self.driver_banner.set_revealed(False)
+
+        self._tick_interval = TICK_ACTIVE
+        self._tick_id = GLib.timeout_add_seconds(self._tick_interval, self._tick)
+        # Writes made while the driver was gone were not seen by the watches
+        self.refresh_all(None, watched=True)
+
+    def _tick(self):
+        """Master timer callback, runs every periodic job"""
+        # No I/O or label updates while nobody can see them
+        if not self.is_shown():
+            self._missed_tick = True
+            return True
 
-        # Fan RPMs
-        for fan_id, card in self.fan_cards.items():
-            rpm = self.read_sysfs(f"{fan_id}/rpm")
-            if rpm:
-                card["rpm_label"].set_label(f"{rpm}")
+        for job in self._tick_jobs:
+            job()
+
+        # Reset by apply_sensor_values as soon as a temperature moves
+        self._stable_ticks += 1
+        if self._stable_ticks >= STABLE_TICKS:
+            self.set_tick_interval(TICK_IDLE)
 
+        # Keep the timer running
         return True
 
+    def set_tick_interval(self, seconds):
+        """Restart the master timer with a new interval"""
+        if seconds == self._tick_interval or not self._tick_id:
+            return
+        self._tick_interval = seconds
+        GLib.source_remove(self._tick_id)
+        self._tick_id = GLib.timeout_add_seconds(seconds, self._tick)
+
+    def poll_fast(self):
+        """Go back to the short poll interval"""
+        self._stable_ticks = 0
+        self.set_tick_interval(TICK_ACTIVE)
+
+    def temps_moved(self, values):
+        """Whether any temperature moved by 1°C or more since it last did"""
+        moved = False
+        get = values.get
+        last_temps = self._last_temps
+        for path, divisor in self._temp_divisors:
+            raw = get(path)
+            if not is_int(raw):
+                continue
+            # Compared in raw units, one divisor is 1°C
+            temp = int(raw)
+            last = last_temps.get(path)
+            # Only move the reference on a real change so slow drifts still add up
+            if last is None or abs(temp - last) >= divisor:
+                last_temps[path] = temp
+                moved = True
+        return moved
+
+    def is_shown(self):
+        """Whether the window is mapped and not minimized"""
+        if not self.get_mapped():
+            return False
+        surface = self.get_surface()
+        if surface is None:
+            return False
+        return not surface.get_state() & Gdk.ToplevelState.MINIMIZED
+
+    def on_active_changed(self, window, pspec):
+        """Refresh everything after ticks were skipped while hidden"""
+        if self._missed_tick and self.is_active():
+            self._missed_tick = False
+            self.refresh_all(None)
+
+    def on_unmap(self, window):
+        """Stop the master timer while the window is unmapped"""
+        if self._tick_id:
+            GLib.source_remove(self._tick_id)
+            self._tick_id = 0
+
+    def on_map(self, window):
+        """Restart the master timer and catch up once the window is mapped again"""
+        # Not while the driver is gone, check_driver() restarts it then
+        if self._tick_id or self._driver_check_id:
+            return
+        self._stable_ticks = 0
+        self._tick_interval = TICK_ACTIVE
+        self._tick_id = GLib.timeout_add_seconds(self._tick_interval, self._tick)
+        self._missed_tick = False
+        self.refresh_all(None)
+
+    def build_poll_paths(self):
+        """Work out the paths read per tick, leaving out hidden fan cards"""
+        polled = tuple(p for p in self._all_poll_paths if p not in self._hidden_paths)
+        self._poll_paths = polled
+        self._unbundled_paths = tuple(p for p in polled if p not in self._status_keys)
+        self._fast_poll_paths = tuple(p for p in polled if p not in self._slow_paths)
+        self._fast_unbundled_paths = tuple(p for p in self._unbundled_paths if p not in self._slow_paths)
+
+    def on_scrolled(self, adjustment):
+        """Re-check which fan cards are visible once scrolling or resizing settles"""
+        if self._scroll_settle_id:
+            GLib.source_remove(self._scroll_settle_id)
+        self._scroll_settle_id = GLib.timeout_add(SCROLL_SETTLE_DELAY, self.update_visible_cards)
+
+    def update_visible_cards(self):
+        """Stop reading the RPM of fan cards outside the scrolled viewport"""
+        self._scroll_settle_id = 0
+        height = self._scroll.get_height()
+        hidden = set()
+        for card in self.fan_cards.values():
+            ok, bounds = card["widget"].compute_bounds(self._scroll)
+            if ok and (bounds.get_y() + bounds.get_height() <= 0 or bounds.get_y() >= height):
+                hidden.add(card["rpm_path"])
+        if hidden == self._hidden_paths:
+            return False
+        shown = self._hidden_paths - hidden
+        self._hidden_paths = frozenset(hidden)
+        self.build_poll_paths()
+        # Cards scrolled into view show a stale RPM until the next tick otherwise
+        if shown:
+            self._job_pool.submit(self.read_shown_worker, tuple(shown))
+        return False
+
+    def read_shown_worker(self, paths):
+        """Worker thread: read the RPM of cards that came into view"""
+        GLib.idle_add(self.update_sensors, self.read_many(paths))
+
+    def read_many(self, paths):
+        """Read a batch of files, returns {path: value}
+
+        EC attributes all go through the one embedded controller, which
+        serializes them anyway, so they are read in turn on the calling
+        thread. The hwmon reads of other devices (NVMe ones send a command
+        to the drive) run on the pool meanwhile.
+        """
+        split = self._batch_split.get(paths)
+        if split is None:
+            ec = tuple(p for p in paths if p.startswith(SYSFS_BASE))
+            split = self._batch_split[paths] = (ec, tuple(p for p in paths if p not in ec))
+        ec, other = split
+        pending = self._io_pool.map(self.read_raw, other)
+        values = {path: self.read_raw(path) for path in ec}
+        values.update(zip(other, pending))
+        return values
+
+    def read_status(self):
+        """Read the aggregate status attribute as {path: value}, None if unusable"""
+        data = self.read_raw(self._status_path)
+        if not data:
+            return None
+        # read_raw hands back the same object for an unchanged line, reuse its parse
+        cached_data, cached_status = self._status_cache
+        if data is cached_data:
+            return cached_status
+        fields = data.split()
+        if len(fields) != len(STATUS_FIELDS):
+            return None
+        status = dict(zip(self._status_keys, fields))
+        self._status_cache = (data, status)
+        return status
+
+    def read_sensors(self, include_slow=True):
+        """Read the polled sensors, using the status attribute when available"""
+        if self._status_path:
+            status = self.read_status()
+            if status is not None:
+                values = self.read_many(self._unbundled_paths if include_slow
+                                        else self._fast_unbundled_paths)
+                values.update(status)
+                return values
+        return self.read_many(self._poll_paths if include_slow else self._fast_poll_paths)
+
+    def update_sensors(self, values):
+        """Update temperature, power and RPM labels from a batch read"""
+        get = values.get
+        for path, update in self._sensor_updaters:
+            update(get(path))
+
+    def apply_fan_mode(self, fan_id, raw):
+        """Select the mode row entry for a raw mode value"""
+        idx = FAN_MODE_INDEX.get(raw)
+        card = self.fan_cards[fan_id]
+        # Compare with the widget itself, a failed write may have left it off sysfs
+        if idx is not None and card["get_mode"]() != idx:
+            card["set_mode"](idx)
+
+    def apply_fan_level(self, fan_id, raw):
+        """Move the level scale to a raw level value"""
+        # The user is still dragging, don't pull the scale back to the last
+        # written value when that write's change notification comes in
+        if not is_int(raw) or fan_id in self._level_pending:
+            return
+        level = int(raw)
+        card = self.fan_cards[fan_id]
+        if card["get_level"]() != level:
+            card["set_level"](level)
+
+    def apply_power_mode(self, raw):
+        """Select the power mode row entry for a raw power mode value"""
+        idx = POWER_MODE_INDEX.get(raw)
+        if idx is not None and self.power_mode_row.get_selected() != idx:
+            self.power_mode_row.set_selected(idx)
+
+    def apply_curve(self, entry, raw):
+        """Show a raw curve value in its entry, unless the user is editing it"""
+        # The focus sits on the entry's inner text widget, not the entry itself
+        focus = self.get_focus()
+        if focus is not None and focus.is_ancestor(entry):
+            return
+        if raw:
+            text = raw.decode(errors="replace")
+            if entry.get_text() != text:
+                entry.set_text(text)
+
+    def watch_ec_files(self):
+        """(Re)create watches for EC attributes that only change on writes"""
+        # Mode and level only change when someone writes them, so watch them
+        # for writes instead of polling them
+        for monitor in self._monitors:
+            monitor.cancel()
+        self._monitors = []
+        for fan_id, card in self.fan_cards.items():
+            self.watch_file(card["mode_path"], self.apply_fan_mode, fan_id)
+            self.watch_file(card["level_path"], self.apply_fan_level, fan_id)
+        # Same for power mode and curves, which refresh_all doesn't re-read
+        self.watch_file(self._power_mode_path, self.apply_power_mode)
+        self.watch_file(self._rampup_path, self.apply_curve, self.rampup_entry)
+        self.watch_file(self._rampdown_path, self.apply_curve, self.rampdown_entry)
+
+    def watch_file(self, path, apply, *args):
+        """Call apply(*args, raw) with the new content whenever path is written"""
+        try:
+            monitor = Gio.File.new_for_path(path).monitor_file(Gio.FileMonitorFlags.NONE, None)
+        except GLib.Error:
+            return
+        monitor.connect("changed", self.on_file_changed, (apply, args))
+        # Keep a reference, the monitor stops when it is garbage collected
+        self._monitors.append(monitor)
+
+    def on_file_changed(self, monitor, file, other_file, event_type, target):
+        """Re-read a watched file asynchronously so the main loop never blocks on it"""
+        if event_type == Gio.FileMonitorEvent.CHANGED:
+            file.load_contents_async(None, self.on_file_loaded, target)
+
+    def on_file_loaded(self, file, result, target):
+        """Pass the content of a re-read watched file on to its apply callback"""
+        try:
+            ok, contents, etag = file.load_contents_finish(result)
+        except GLib.Error:
+            return
+        apply, args = target
+        apply(*args, contents.rstrip(SYSFS_WHITESPACE))
+
     def on_mode_changed(self, combo, pspec, fan_id):
         """Handle mode change"""
-        modes = ["auto", "fixed", "curve"]
+        self.poll_fast()
         selected = combo.get_selected()
-        if selected < len(modes):
-            self.write_sysfs(f"{fan_id}/mode", modes[selected])
+        if selected < len(FAN_MODES):
+            self.write_sysfs(self.fan_cards[fan_id]["mode_path"], FAN_MODES[selected])
 
     def on_level_changed(self, scale, fan_id):
         """Handle level change"""
-        level = int(scale.get_value())
-        self.write_sysfs(f"{fan_id}/level", str(level))
+        self.poll_fast()
+        # Dragging fires this for every step, only write the latest value
+        self._level_pending[fan_id] = int(scale.get_value())
+        if not self._level_timer:
+            self._level_timer = GLib.timeout_add(LEVEL_WRITE_DELAY, self.flush_levels)
+
+    def flush_levels(self):
+        """Write the pending fan levels, once per fan"""
+        self._level_timer = 0
+        pairs = [(self.fan_cards[fan_id]["level_path"], LEVEL_BYTES[level])
+                 for fan_id, level in self._level_pending.items()]
+        self._level_pending.clear()
+        self.write_many(pairs)
+        return False
 
     def on_power_mode_changed(self, combo, pspec):
         """Handle power mode change"""
-        modes = ["quiet", "balanced", "performance"]
+        self.poll_fast()
         selected = combo.get_selected()
-        if selected < len(modes):
-            self.write_sysfs("apu/power_mode", modes[selected])
+        if selected < len(POWER_MODES):
+            self.write_sysfs(self._power_mode_path, POWER_MODES[selected])
 
     def apply_curves(self, button):
         """Apply curve settings"""
         rampup = self.rampup_entry.get_text().strip()
         rampdown = self.rampdown_entry.get_text().strip()
 
-        success = True
+        # All six writes go out together, with at most one error dialog
+        pairs = []
         if rampup:
-            for fan_id in ["fan1", "fan2", "fan3"]:
-                if not self.write_sysfs(f"{fan_id}/rampup_curve", rampup):
-                    success = False
-
+            pairs += [(card["rampup_path"], rampup) for card in self.fan_cards.values()]
         if rampdown:
-            for fan_id in ["fan1", "fan2", "fan3"]:
-                if not self.write_sysfs(f"{fan_id}/rampdown_curve", rampdown):
-                    success = False
-
+            pairs += [(card["rampdown_path"], rampdown) for card in self.fan_cards.values()]
+        # Written off the main loop, every rampup curve before any rampdown curve
+        self._job_pool.submit(self.write_curves_worker, pairs)
+
+    def write_curves_worker(self, pairs):
+        """Worker thread: write the curves in order, then report on the main loop"""
+        results = [self.try_write(pair) for pair in pairs]
+        GLib.idle_add(self.on_curves_written, pairs, results)
+
+    def on_curves_written(self, pairs, results):
+        """Report failed curve writes and show the new state"""
+        self.report_writes(pairs, results)
         self.refresh_all(None)
+        return False
 
 def main():
     if not os.path.exists(SYSFS_BASE):